@@ -11,6 +11,17 @@ from pathlib import Path
 from datetime import datetime
 
 
+def write_atomic(path: Path, text: str):
+    """Write via a temp file + os.replace so readers never see a half-written file."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(text)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def parse_steps_yaml(content: str) -> list:
     """Simple YAML parser for steps configuration."""
     steps = []
@@ -100,36 +111,34 @@ def main():
             return
 
         # Check if tool matches gate_tool pattern
-        tool_matches = False
-        if gate_tool:
-            # gate_tool can be a prefix like "mcp__Context7__" or full name
-            if tool_name.startswith(gate_tool) or gate_tool in tool_name:
-                tool_matches = True
+        # gate_tool can be a prefix like "mcp__Context7__" or full name;
+        # both are substring matches
+        tool_matches = bool(gate_tool) and gate_tool in tool_name
 
         if tool_matches:
             # Advance to next step
             new_step_idx = current_step_idx + 1
 
             if new_step_idx < len(steps):
+                ts = datetime.now().isoformat()
                 state["current_step"] = new_step_idx
                 state["completed_steps"] = state.get("completed_steps", [])
                 state["completed_steps"].append({
                     "id": current_step.get("id", f"step_{current_step_idx}"),
-                    "completed_at": datetime.now().isoformat(),
+                    "completed_at": ts,
                     "reason": f"Gate tool used: {tool_name}"
                 })
                 state["step_history"] = state.get("step_history", [])
                 state["step_history"].append({
                     "from_step": current_step_idx,
                     "to_step": new_step_idx,
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": ts,
                     "reason": f"Auto-advance: gate tool {tool_name}"
                 })
-                state["last_activity"] = datetime.now().isoformat()
+                state["last_activity"] = ts
 
                 # Save updated state
-                with open(state_file, 'w') as f:
-                    json.dump(state, f, indent=2)
+                write_atomic(state_file, json.dumps(state, indent=2))
 
                 # Print notification to stderr (visible to user)
                 next_step = steps[new_step_idx]
@@ -14,6 +14,7 @@ Uso:
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 from datetime import datetime
@@ -32,9 +33,20 @@ def load_state():
     return {"current_step": 0, "completed_steps": [], "step_history": []}
 
 
-def save_state(state):
-    state["last_activity"] = datetime.now().isoformat()
-    STATE_FILE.write_text(json.dumps(state, indent=2))
+def write_atomic(path, text):
+    """Escribe vía archivo temporal + os.replace para no dejar archivos a medias."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(text)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def save_state(state, ts=None):
+    state["last_activity"] = ts or datetime.now().isoformat()
+    write_atomic(STATE_FILE, json.dumps(state, indent=2))
 
 
 def load_steps():
@@ -98,15 +110,16 @@ def cmd_status():
 
 def cmd_reset():
     """Resetea el pipeline a step 0."""
+    ts = datetime.now().isoformat()
     state = {
         "current_step": 0,
         "completed_steps": [],
         "session_id": None,
-        "started_at": datetime.now().isoformat(),
+        "started_at": ts,
         "last_activity": None,
         "step_history": []
     }
-    save_state(state)
+    save_state(state, ts)
     print("✅ Pipeline reseteado a Step 0")
 
 
@@ -120,19 +133,20 @@ def cmd_advance():
         print("⚠️ Ya estás en el último step")
         return
 
+    ts = datetime.now().isoformat()
     state["current_step"] = current + 1
     state["completed_steps"].append({
         "id": steps[current].get("id", f"step_{current}"),
-        "completed_at": datetime.now().isoformat(),
+        "completed_at": ts,
         "reason": "Manual advance"
     })
     state["step_history"].append({
         "from_step": current,
         "to_step": current + 1,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": ts,
         "reason": "Manual advance"
     })
-    save_state(state)
+    save_state(state, ts)
 
     next_step = steps[current + 1]
     print(f"✅ Avanzado a Step {current + 1}: {next_step.get('name', next_step.get('id'))}")
@@ -196,43 +210,44 @@ def load_config():
 
 
 def save_config(config):
-    """Guarda la configuración en YAML."""
+    """Guarda la configuración en YAML.
+
+    Reemplaza el bloque `config:` completo de una vez (o lo inserta antes de
+    `steps:` si no existe), conservando comentarios, líneas en blanco y el
+    resto del archivo.
+    """
     if not STEPS_FILE.exists():
         print("❌ No existe el archivo steps.yaml")
         return False
 
-    content = STEPS_FILE.read_text()
-    lines = content.split('\n')
-    new_lines = []
-    in_config = False
-    config_written = False
-
-    for line in lines:
-        stripped = line.strip()
-
-        if stripped == "config:":
-            in_config = True
-            new_lines.append(line)
-            # Write new config values
-            new_lines.append(f"  reset_policy: \"{config.get('reset_policy', 'timeout')}\"")
-            new_lines.append(f"  timeout_minutes: {config.get('timeout_minutes', 30)}")
-            new_lines.append(f"  force_sequential: {str(config.get('force_sequential', False)).lower()}")
-            config_written = True
-            continue
-
-        if in_config and stripped.startswith("steps:"):
-            in_config = False
-            new_lines.append("")  # Empty line before steps
-            new_lines.append(line)
-            continue
-
-        if in_config and not stripped.startswith('#') and ':' in stripped:
-            # Skip old config lines
-            continue
-
-        new_lines.append(line)
-
-    STEPS_FILE.write_text('\n'.join(new_lines))
+    lines = STEPS_FILE.read_text().split('\n')
+    block = [
+        "config:",
+        f"  reset_policy: \"{config.get('reset_policy', 'timeout')}\"",
+        f"  timeout_minutes: {config.get('timeout_minutes', 30)}",
+        f"  force_sequential: {str(config.get('force_sequential', False)).lower()}",
+    ]
+
+    start = next((i for i, line in enumerate(lines) if line.strip() == "config:"), None)
+    if start is None:
+        # No config section yet: add it before steps (or at the end)
+        start = end = next(
+            (i for i, line in enumerate(lines) if line.strip().startswith("steps:")), len(lines)
+        )
+        kept = [""]
+    else:
+        # The section runs until the next non-indented line
+        end = start + 1
+        while end < len(lines) and (not lines[end].strip() or lines[end][0] in ' \t'):
+            end += 1
+        # Only the old key lines are replaced; comments and blank lines stay in place
+        kept = [
+            line for line in lines[start + 1:end]
+            if not line.strip() or line.strip().startswith('#')
+        ]
+
+    lines[start:end] = block + kept
+    write_atomic(STEPS_FILE, '\n'.join(lines))
     return True
 
 
@@ -25,6 +25,11 @@ class EdgeCondition:
     type: str  # 'tool', 'phrase', 'always', 'default'
     tool: Optional[str] = None
     phrases: list[str] = field(default_factory=list)
+    # (lowercased, original) phrases, built on first match; graphs are cached
+    # across tool calls, so phrases are lowercased once per parse
+    _phrases_lower: Optional[list[tuple[str, str]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def matches_tool(self, mcp_name: str, tool_name: str) -> bool:
         """Check if a tool call matches this condition."""
@@ -33,13 +38,9 @@ class EdgeCondition:
         if not self.tool:
             return self.type == 'default'
 
-        full_name = f"mcp__{mcp_name}__{tool_name}"
-        # Support partial matching (prefix or contains)
-        return (
-            full_name == self.tool or
-            full_name.startswith(self.tool) or
-            self.tool in full_name
-        )
+        # Support partial matching: exact and prefix matches are both
+        # substring matches, so one `in` covers all three cases
+        return self.tool in f"mcp__{mcp_name}__{tool_name}"
 
     def matches_phrase(self, text: str) -> tuple[bool, Optional[str]]:
         """Check if text contains any matching phrase.
@@ -52,9 +53,12 @@ class EdgeCondition:
         if not self.phrases:
             return self.type == 'default', None
 
+        if self._phrases_lower is None:
+            self._phrases_lower = [(phrase.lower(), phrase) for phrase in self.phrases]
+
         text_lower = text.lower()
-        for phrase in self.phrases:
-            if phrase.lower() in text_lower:
+        for phrase_lower, phrase in self._phrases_lower:
+            if phrase_lower in text_lower:
                 return True, phrase
         return False, None
 
@@ -119,6 +123,16 @@ class Graph:
     def __post_init__(self):
         """Build edge index after initialization."""
         self._rebuild_edge_index()
+        # Memoized response fragments (invariant while the graph is unchanged)
+        self._edges_info_cache: dict[str, list[dict]] = {}
+        self._mermaid_body: Optional[str] = None
+        self._validation_errors: Optional[list[str]] = None
+
+    def _invalidate_caches(self):
+        """Drop memoized fragments after a structural change."""
+        self._edges_info_cache.clear()
+        self._mermaid_body = None
+        self._validation_errors = None
 
     def _rebuild_edge_index(self):
         """Rebuild the edges_by_source index."""
@@ -135,6 +149,7 @@ class Graph:
     def add_node(self, node: Node):
         """Add a node to the graph."""
         self.nodes[node.id] = node
+        self._invalidate_caches()
 
     def add_edge(self, edge: Edge):
         """Add an edge and update the index."""
@@ -143,6 +158,7 @@ class Graph:
             self.edges_by_source[edge.from_node] = []
         self.edges_by_source[edge.from_node].append(edge)
         self.edges_by_source[edge.from_node].sort(key=lambda e: e.priority)
+        self._invalidate_caches()
 
     def get_start_node(self) -> Optional[Node]:
         """Get the designated start node."""
@@ -156,12 +172,39 @@ class Graph:
         """Get all edges leaving a node, sorted by priority."""
         return self.edges_by_source.get(node_id, [])
 
+    def get_edges_info(self, node_id: str) -> list[dict]:
+        """Get outgoing edges of a node as response dicts (memoized per node)."""
+        cached = self._edges_info_cache.get(node_id)
+        if cached is not None:
+            return cached
+
+        edges_info = []
+        for edge in self.get_outgoing_edges(node_id):
+            edge_info = {
+                "id": edge.id,
+                "to": edge.to_node,
+                "to_name": self.nodes[edge.to_node].name if edge.to_node in self.nodes else edge.to_node,
+                "condition_type": edge.condition.type,
+                "priority": edge.priority
+            }
+            if edge.condition.tool:
+                edge_info["condition_tool"] = edge.condition.tool
+            if edge.condition.phrases:
+                edge_info["condition_phrases"] = edge.condition.phrases
+            edges_info.append(edge_info)
+
+        self._edges_info_cache[node_id] = edges_info
+        return edges_info
+
     def validate(self) -> list[str]:
-        """Validate graph structure.
+        """Validate graph structure (memoized until the graph changes).
 
         Returns:
             List of validation errors (empty if valid)
         """
+        if self._validation_errors is not None:
+            return list(self._validation_errors)
+
         errors = []
 
         # Check for start node
@@ -192,7 +235,8 @@ class Graph:
             if edge.to_node not in self.nodes:
                 errors.append(f"Edge '{edge.id}' references unknown to_node: {edge.to_node}")
 
-        return errors
+        self._validation_errors = errors
+        return list(errors)
 
 
 @dataclass
@@ -369,9 +413,23 @@ def generate_mermaid(graph: Graph, state: Optional[GraphState] = None) -> str:
     Returns:
         Mermaid flowchart diagram as string
     """
-    lines = ["flowchart TD"]
     current_node = state.get_current_node() if state else None
 
+    # Static part of the diagram only depends on the graph - build it once
+    if graph._mermaid_body is None:
+        graph._mermaid_body = "\n".join(_build_mermaid_body(graph))
+
+    # Highlight current node
+    if current_node:
+        return f"{graph._mermaid_body}\n    style {current_node} fill:#90EE90,stroke:#333,stroke-width:3px"
+
+    return graph._mermaid_body
+
+
+def _build_mermaid_body(graph: Graph) -> list[str]:
+    """Build the node and edge lines of a Mermaid diagram."""
+    lines = ["flowchart TD"]
+
     # Add nodes
     for node_id, node in graph.nodes.items():
         label = node.name.replace('"', "'")
@@ -401,8 +459,4 @@ def generate_mermaid(graph: Graph, state: Optional[GraphState] = None) -> str:
 
         lines.append(f"    {edge.from_node} -->{label} {edge.to_node}")
 
-    # Highlight current node
-    if current_node:
-        lines.append(f"    style {current_node} fill:#90EE90,stroke:#333,stroke-width:3px")
-
-    return "\n".join(lines)
+    return lines
@@ -2,8 +2,12 @@
 
 Parses the graph YAML format into Graph, Node, and Edge objects.
 Uses a simple hand-rolled parser to avoid PyYAML dependency issues.
+Parsed graphs are cached by the server until graph.yaml changes, so parser
+speed is off the hot path. A YAML 1.1 loader would also coerce values the
+graph format treats as strings (e.g. ids like "no"/"on", versions like 1.0).
 """
 
+import sys
 from pathlib import Path
 from typing import Optional, Any
 
@@ -317,6 +321,10 @@ def parse_graph_yaml(content: str) -> Graph:
         elif not isinstance(tools_blocked, list):
             tools_blocked = []
 
+        # Intern ids and MCP names - they repeat across edges, state and responses
+        node_id = sys.intern(str(node_id))
+        mcps_enabled = [sys.intern(m) if isinstance(m, str) else m for m in mcps_enabled]
+
         node = Node(
             id=node_id,
             name=node_data.get('name', node_id),
@@ -365,6 +373,9 @@ def parse_graph_yaml(content: str) -> Graph:
         elif not isinstance(condition_phrases, list):
             condition_phrases = []
 
+        if isinstance(condition_tool, str):
+            condition_tool = sys.intern(condition_tool)
+
         condition = EdgeCondition(
             type=condition_type,
             tool=condition_tool,
@@ -372,9 +383,9 @@ def parse_graph_yaml(content: str) -> Graph:
         )
 
         edge = Edge(
-            id=edge_id,
-            from_node=from_node,
-            to_node=to_node,
+            id=sys.intern(str(edge_id)),
+            from_node=sys.intern(str(from_node)),
+            to_node=sys.intern(str(to_node)),
             condition=condition,
             priority=int(edge_data.get('priority', 1))
         )
@@ -9,9 +9,11 @@ Architecture (Centralized Hub - AgentCockpit):
 """
 
 import json
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from .graph_engine import GraphState, PathEntry, Graph
 
@@ -43,6 +45,10 @@ def _load_hub_config() -> dict:
         return {}
 
 
+# Resolved per-project paths: project_dir -> (graph_state.json, graph.yaml)
+_project_paths_cache: dict[str, tuple[Path, Path]] = {}
+
+
 def _get_centralized_state_dir(project_dir: str) -> Path:
     """Get the centralized state directory for a project.
 
@@ -61,19 +67,77 @@ def _get_centralized_state_dir(project_dir: str) -> Path:
     return Path(project_dir) / ".claude" / "pipeline"
 
 
+def _get_project_paths(project_dir: str) -> tuple[Path, Path]:
+    """Resolve (state file, graph file) for a project once per process.
+
+    The hub state dir is created on first resolution; write_atomic
+    recreates it if it is removed later. The local fallback is not
+    memoized, so a hub configured later is picked up.
+    """
+    paths = _project_paths_cache.get(project_dir)
+    if paths is None:
+        paths = (
+            _get_centralized_state_dir(project_dir) / "graph_state.json",
+            Path(project_dir) / ".claude" / "pipeline" / "graph.yaml",
+        )
+        if "hub_dir" in _load_hub_config():
+            _project_paths_cache[project_dir] = paths
+    return paths
+
+
 def get_graph_state_file(project_dir: str) -> Path:
     """Get the graph state file path for a project (CENTRALIZED in hub)."""
-    return _get_centralized_state_dir(project_dir) / "graph_state.json"
+    return _get_project_paths(project_dir)[0]
 
 
 def get_graph_file(project_dir: str) -> Path:
     """Get the active graph file path for a project (LOCAL copy)."""
-    return Path(project_dir) / ".claude" / "pipeline" / "graph.yaml"
+    return _get_project_paths(project_dir)[1]
+
+
+def stat_cached(cache: dict[Path, tuple[tuple[int, int], Any]], path: Path,
+                parse: Callable[[Path], Any]) -> Any:
+    """Return parse(path), reused while the file's (st_mtime_ns, st_size) is unchanged.
+
+    Exceptions from parse propagate and nothing is cached.
+
+    Raises:
+        OSError: If the file can't be stat'ed (its cache entry is dropped)
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        cache.pop(path, None)
+        raise
+
+    key = (st.st_mtime_ns, st.st_size)
+    cached = cache.get(path)
+    if cached and cached[0] == key:
+        return cached[1]
+
+    value = parse(path)
+    cache[path] = (key, value)
+    return value
+
+
+# Parsed state files: path -> ((st_mtime_ns, st_size), data)
+_state_data_cache: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+def _read_state_data(state_file: Path) -> Optional[dict]:
+    """Return the parsed state file, re-reading it only when it changes."""
+    try:
+        return stat_cached(_state_data_cache, state_file, lambda p: json.loads(p.read_text()))
+    except OSError:
+        return None
 
 
 def load_graph_state(project_dir: str) -> GraphState:
     """Load graph state from file.
 
+    The parsed file is cached until its mtime or size changes; every call
+    still returns a fresh GraphState, so callers may mutate it.
+
     Args:
         project_dir: Project directory path
 
@@ -82,11 +146,10 @@ def load_graph_state(project_dir: str) -> GraphState:
     """
     state_file = get_graph_state_file(project_dir)
 
-    if not state_file.exists():
-        return GraphState()
-
     try:
-        data = json.loads(state_file.read_text())
+        data = _read_state_data(state_file)
+        if data is None:
+            return GraphState()
 
         # Parse execution path
         execution_path: list[PathEntry] = []
@@ -101,8 +164,8 @@ def load_graph_state(project_dir: str) -> GraphState:
             execution_path.append(entry)
 
         return GraphState(
-            current_nodes=data.get('current_nodes', []),
-            node_visits=data.get('node_visits', {}),
+            current_nodes=list(data.get('current_nodes', [])),
+            node_visits=dict(data.get('node_visits', {})),
             execution_path=execution_path,
             active_graph=data.get('active_graph'),
             max_visits_default=data.get('max_visits_default', 10),
@@ -113,18 +176,43 @@ def load_graph_state(project_dir: str) -> GraphState:
         return GraphState()
 
 
+# Last write per state file: path -> ((st_mtime_ns, st_size), content minus last_activity)
+_saved_state_content: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
+def write_atomic(path: Path, text: str):
+    """Write text via a temp file + os.replace so readers never see a torn file.
+
+    The parent directory is only created when the write finds it missing,
+    so the common case costs no extra mkdir/stat.
+    """
+    # pid + thread id: concurrent writers (other processes, to_thread workers)
+    # never share a temp file.
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        try:
+            tmp.write_text(text, encoding='utf-8')
+        except FileNotFoundError:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(text, encoding='utf-8')
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
 def save_graph_state(project_dir: str, state: GraphState):
     """Save graph state to file.
 
+    Skips the write when nothing but last_activity would change and the file
+    is still the one this process last wrote (the desktop app writes it too).
+
     Args:
         project_dir: Project directory path
         state: GraphState to save
     """
     state_file = get_graph_state_file(project_dir)
 
-    # Ensure directory exists
-    state_file.parent.mkdir(parents=True, exist_ok=True)
-
     # Serialize execution path
     execution_path_data = []
     for entry in state.execution_path:
@@ -136,9 +224,6 @@ def save_graph_state(project_dir: str, state: GraphState):
             'reason': entry.reason
         })
 
-    # Update last_activity
-    state.last_activity = datetime.now().isoformat()
-
     data = {
         'current_nodes': state.current_nodes,
         'node_visits': state.node_visits,
@@ -149,7 +234,34 @@ def save_graph_state(project_dir: str, state: GraphState):
         'last_activity': state.last_activity
     }
 
-    state_file.write_text(json.dumps(data, indent=2))
+    # Plain dict comparison: no extra serialization on top of the write below.
+    # Copy the live containers so later mutation of `state` can't leak in.
+    content = {
+        **data,
+        'current_nodes': list(state.current_nodes),
+        'node_visits': dict(state.node_visits)
+    }
+    del content['last_activity']
+    saved = _saved_state_content.get(state_file)
+    if saved and saved[1] == content:
+        try:
+            st = state_file.stat()
+            if saved[0] == (st.st_mtime_ns, st.st_size):
+                return
+        except OSError:
+            pass
+
+    # Update last_activity
+    state.last_activity = datetime.now().isoformat()
+    data['last_activity'] = state.last_activity
+
+    write_atomic(state_file, json.dumps(data, indent=2))
+    st = state_file.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    _saved_state_content[state_file] = (key, content)
+
+    # Write-through: the next load_graph_state is served without re-reading.
+    _state_data_cache[state_file] = (key, {**content, 'last_activity': state.last_activity})
 
 
 def initialize_graph_state(project_dir: str, graph: Graph, graph_name: str) -> GraphState:
@@ -167,6 +279,7 @@ def initialize_graph_state(project_dir: str, graph: Graph, graph_name: str) -> G
     if not start_node:
         raise ValueError("Graph has no start node")
 
+    now = datetime.now().isoformat()
     state = GraphState(
         current_nodes=[start_node.id],
         node_visits={start_node.id: 1},
@@ -175,14 +288,14 @@ def initialize_graph_state(project_dir: str, graph: Graph, graph_name: str) -> G
                 from_node=None,
                 to_node=start_node.id,
                 edge_id=None,
-                timestamp=datetime.now().isoformat(),
+                timestamp=now,
                 reason="Graph initialized"
             )
         ],
         active_graph=graph_name,
         max_visits_default=10,
         total_transitions=0,
-        last_activity=datetime.now().isoformat()
+        last_activity=now
     )
 
     save_graph_state(project_dir, state)
@@ -207,6 +320,7 @@ def reset_graph_state(project_dir: str, graph: Graph) -> GraphState:
     if not start_node:
         raise ValueError("Graph has no start node")
 
+    now = datetime.now().isoformat()
     state = GraphState(
         current_nodes=[start_node.id],
         node_visits={start_node.id: 1},
@@ -215,14 +329,14 @@ def reset_graph_state(project_dir: str, graph: Graph) -> GraphState:
                 from_node=None,
                 to_node=start_node.id,
                 edge_id=None,
-                timestamp=datetime.now().isoformat(),
+                timestamp=now,
                 reason="Graph reset"
             )
         ],
         active_graph=graph_name,
         max_visits_default=existing.max_visits_default,
         total_transitions=0,
-        last_activity=datetime.now().isoformat()
+        last_activity=now
     )
 
     save_graph_state(project_dir, state)
@@ -16,10 +16,17 @@ Architecture (Centralized Hub - AgentCockpit):
 
 import os
 import json
+import re
 import asyncio
+import hashlib
+import heapq
+import math
 import subprocess
+import sys
+import time
 import uuid
-from difflib import SequenceMatcher
+from collections import deque
+from itertools import count
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Any
@@ -33,7 +40,8 @@ from .graph_engine import (
 from .graph_parser import parse_graph_yaml, load_graph_from_file, GraphParseError
 from .graph_state import (
     load_graph_state, save_graph_state, initialize_graph_state,
-    reset_graph_state, get_graph_state_file, get_graph_file, get_node_visit_warning
+    reset_graph_state, get_graph_state_file, get_graph_file, get_node_visit_warning,
+    write_atomic, stat_cached
 )
 
 # Create FastMCP server
@@ -109,7 +117,9 @@ def get_project_state_dir(project_dir: str) -> Path:
 
 # Global session storage - persists within MCP server process
 # Key: session_id, Value: {"project_dir": str, "created_at": str}
+# Insertion order is LRU order; least recently used sessions are evicted past the cap
 _session_store: dict[str, dict] = {}
+SESSION_STORE_MAX = 1024
 
 # Default session for single-project use (most common case)
 _default_session: dict = {"project_dir": None}
@@ -125,7 +135,8 @@ def get_or_create_session(session_id: str | None = None) -> str:
 def get_session_project_dir(session_id: str | None) -> str | None:
     """Get project_dir for a specific session or default."""
     if session_id and session_id in _session_store:
-        return _session_store[session_id].get("project_dir")
+        session = _session_store[session_id] = _session_store.pop(session_id)  # Mark as recently used
+        return session.get("project_dir")
     # Fall back to default session
     return _default_session.get("project_dir")
 
@@ -133,9 +144,11 @@ def get_session_project_dir(session_id: str | None) -> str | None:
 def set_session_project_dir(session_id: str | None, project_dir: str):
     """Store project_dir for a specific session or default."""
     if session_id:
-        if session_id not in _session_store:
-            _session_store[session_id] = {"created_at": datetime.now().isoformat()}
-        _session_store[session_id]["project_dir"] = project_dir
+        session = _session_store.pop(session_id, None) or {"created_at": datetime.now().isoformat()}
+        session["project_dir"] = project_dir
+        _session_store[session_id] = session
+        while len(_session_store) > SESSION_STORE_MAX:
+            del _session_store[next(iter(_session_store))]
     # Always update default for convenience
     _default_session["project_dir"] = project_dir
 
@@ -145,6 +158,9 @@ def resolve_project_dir(project_dir: str | None, session_id: str | None = None)
 
     Returns (project_dir, session_id).
     Priority: explicit parameter > session cache > default > error
+
+    Intentionally not memoized: an explicit project_dir updates the session
+    store as a side effect, and the lookup itself is two dict reads.
     """
     sid = session_id or "default"
 
@@ -215,6 +231,22 @@ TOOL_CATEGORIES = {
     }
 }
 
+def _alternation(words: list[str]) -> "re.Pattern[str]":
+    # Plain substring alternation; (?!) never matches if words is empty
+    return re.compile("|".join(map(re.escape, words)) or "(?!)")
+
+
+# TOOL_CATEGORIES compiled once, in priority order:
+# (category, name matcher for patterns + keywords, description matcher for keywords)
+_CATEGORY_MATCHERS = [
+    (
+        cat_name,
+        _alternation(cat_info.get("patterns", []) + cat_info.get("keywords", [])),
+        _alternation(cat_info.get("keywords", []))
+    )
+    for cat_name, cat_info in TOOL_CATEGORIES.items()
+]
+
 # Stopwords to filter from queries (common words that add noise)
 STOPWORDS = {
     "the", "a", "an", "is", "are", "was", "were", "be", "been", "being",
@@ -281,16 +313,13 @@ def save_learned_weights():
     """Save learned weights to global file."""
     global _learned_weights
 
-    # Ensure directory exists
-    LEARNED_WEIGHTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-
     data = {
         "weights": _learned_weights,
         "last_updated": datetime.now().isoformat(),
         "version": "1.0"
     }
 
-    LEARNED_WEIGHTS_FILE.write_text(json.dumps(data, indent=2))
+    write_atomic(LEARNED_WEIGHTS_FILE, json.dumps(data, indent=2))
 
 
 def extract_keywords(text: str) -> set[str]:
@@ -325,32 +354,6 @@ def record_tool_selection(query: str, mcp_name: str, tool_name: str):
     save_learned_weights()
 
 
-def get_learned_boost(query: str, mcp_name: str, tool_name: str) -> float:
-    """Calculate learned boost for a tool given a query."""
-    global _learned_weights
-
-    # Load weights if not loaded
-    if not _learned_weights:
-        load_learned_weights()
-
-    tool_key = f"{mcp_name}:{tool_name}"
-
-    if tool_key not in _learned_weights:
-        return 0.0
-
-    keywords = extract_keywords(query)
-    if not keywords:
-        return 0.0
-
-    tool_weights = _learned_weights[tool_key]
-
-    # Sum weights for matching keywords
-    total_boost = sum(tool_weights.get(kw, 0.0) for kw in keywords)
-
-    # Normalize by number of query keywords
-    return total_boost / len(keywords)
-
-
 def set_last_search(query: str, results: list[dict]):
     """Track the last search for correlation with tool selection."""
     global _last_search_query, _last_search_results
@@ -376,10 +379,17 @@ def check_and_record_selection(mcp_name: str, tool_name: str):
 # Tool index cache for semantic search
 _tool_index: dict[str, list[dict]] = {}
 
+# Inverted index per MCP, rebuilt by build_tool_index: keyword -> tool positions
+_keyword_postings: dict[str, dict[str, list[int]]] = {}
+
 
 def build_tool_index(mcp_name: str, tools: list[dict]) -> list[dict]:
-    """Build searchable index of tools with extracted keywords."""
+    """Build searchable index of tools with extracted keywords.
+
+    Also rebuilds the keyword postings for mcp_name used by semantic_search.
+    """
     indexed = []
+    postings: dict[str, list[int]] = {}
     for tool in tools:
         name = tool.get("name", "")
         desc = tool.get("description", "")
@@ -397,80 +407,136 @@ def build_tool_index(mcp_name: str, tools: list[dict]) -> list[dict]:
         # Detect category
         category = detect_tool_category(name, desc)
 
+        description = desc[:150] if desc else ""  # Truncate for token efficiency
+        # Interned so common tokens ("container", "file", ...) are stored once
+        # across all tools and postings; frozenset drops the set growth slack
+        keywords = frozenset(sys.intern(word) for word in name_words | desc_words)
+        for keyword in keywords:
+            postings.setdefault(keyword, []).append(len(indexed))
+
         indexed.append({
             "name": name,
-            "description": desc[:150] if desc else "",  # Truncate for token efficiency
-            "keywords": name_words | desc_words,
-            "category": category
+            "description": description,
+            "keywords": keywords,
+            "category": category,
+            # Lowercased once here instead of on every search
+            "name_lower": name.lower(),
+            "description_lower": description.lower()
         })
 
+    _keyword_postings[mcp_name] = postings
     return indexed
 
 
 def detect_tool_category(name: str, description: str) -> str:
-    """Detect category for a tool based on name and description patterns."""
+    """Detect category for a tool based on name and description patterns.
+
+    The first category (in TOOL_CATEGORIES order) whose patterns or keywords
+    occur in the name, or whose keywords occur in the description, wins.
+    """
     name_lower = name.lower()
     desc_lower = description.lower() if description else ""
 
-    for cat_name, cat_info in TOOL_CATEGORIES.items():
-        # Check patterns in name
-        for pattern in cat_info.get("patterns", []):
-            if pattern in name_lower:
-                return cat_name
-
-        # Check keywords in name or description
-        for keyword in cat_info.get("keywords", []):
-            if keyword in name_lower or keyword in desc_lower:
-                return cat_name
+    for cat_name, name_matcher, desc_matcher in _CATEGORY_MATCHERS:
+        if name_matcher.search(name_lower) or desc_matcher.search(desc_lower):
+            return cat_name
 
     return "other"
 
 
+def _ratio_upper_bound(a: str, b: str) -> float:
+    """Upper bound of SequenceMatcher(None, a, b).ratio() from lengths alone."""
+    total = len(a) + len(b)
+    return 2.0 * min(len(a), len(b)) / total if total else 1.0
+
+
+def _keyword_hits(mcp_name: str, query_words: set[str]) -> dict[int, int]:
+    """Tool positions sharing a keyword with the query, mapped to how many.
+
+    The counts come from the postings, so scoring needs no per-tool set
+    intersection; tools missing here match no query word.
+    """
+    postings = _keyword_postings.get(mcp_name, {})
+    hits: dict[int, int] = {}
+    for word in query_words:
+        for position in postings.get(word, ()):
+            hits[position] = hits.get(position, 0) + 1
+    return hits
+
+
 def semantic_search(query: str, mcp_filter: str | None = None, max_results: int = 10) -> list[dict]:
-    """Search tools by objective/description using semantic similarity + learned weights."""
+    """Search tools by objective/description using semantic similarity + learned weights.
+
+    Every tool is scored; SequenceMatcher only runs for tools whose length
+    bound shows they could still clear the threshold.
+    """
+    from difflib import SequenceMatcher  # Deferred: only tool search needs difflib
+
     # Extract keywords filtering stopwords
     query_words = extract_keywords(query)
+    learned_keywords = query_words  # Learned boosts only use real keywords, never the raw-word fallback
 
     if not query_words:
         # Fallback to raw words if all were stopwords
         query_words = set(query.lower().split())
 
+    if not _learned_weights:
+        load_learned_weights()
+    learned_weights = _learned_weights
+
+    query_lower = query.lower()
     results = []
+    query_count = max(len(query_words), 1)
 
     for mcp_name, tools in _tool_index.items():
         if mcp_filter and mcp_name != mcp_filter:
             continue
 
-        for tool in tools:
+        hits = _keyword_hits(mcp_name, query_words)
+        for position, tool in enumerate(tools):
+            tool_name = tool["name"]
+
             # Base score: keyword intersection + string similarity
-            keyword_score = len(query_words & tool["keywords"]) / max(len(query_words), 1)
-            name_score = SequenceMatcher(None, query.lower(), tool["name"].lower()).ratio()
-            desc_score = SequenceMatcher(None, query.lower(), tool["description"].lower()).ratio()
+            keyword_score = hits.get(position, 0) / query_count
+
+            # Apply learned boost from user selections: mean weight of the
+            # query's keywords (extracted once, not per tool)
+            tool_weights = learned_weights.get(f"{mcp_name}:{tool_name}")
+            if tool_weights and learned_keywords:
+                learned_boost = sum(tool_weights.get(kw, 0.0) for kw in learned_keywords) / len(learned_keywords)
+            else:
+                learned_boost = 0.0
+
+            # Skip the SequenceMatcher work when even perfect similarity within
+            # the length bound (ratio <= 2*min/(sum)) can't reach the threshold
+            name_bound = _ratio_upper_bound(query_lower, tool["name_lower"])
+            desc_bound = _ratio_upper_bound(query_lower, tool["description_lower"])
+            if (keyword_score * 0.5) + (name_bound * 0.3) + (desc_bound * 0.2) + learned_boost <= 0.15:
+                continue
+
+            name_score = SequenceMatcher(None, query_lower, tool["name_lower"]).ratio()
+            desc_score = SequenceMatcher(None, query_lower, tool["description_lower"]).ratio()
 
             # Base weighted combination
             base_score = (keyword_score * 0.5) + (name_score * 0.3) + (desc_score * 0.2)
 
-            # Apply learned boost from user selections
-            learned_boost = get_learned_boost(query, mcp_name, tool["name"])
-
             # Final score = base + learned (learned can significantly boost)
             final_score = base_score + learned_boost
 
             if final_score > 0.15:  # Minimum threshold
                 results.append({
                     "mcp": mcp_name,
-                    "tool": tool["name"],
+                    "tool": tool_name,
                     "description": tool["description"],
-                    "category": tool.get("category", "other"),
+                    "category": tool["category"],
                     "score": round(final_score, 2),
                     "learned_boost": round(learned_boost, 2) if learned_boost > 0 else None
                 })
 
-    # Sort by score descending
-    results.sort(key=lambda x: x["score"], reverse=True)
+    # Top results by score (same order as a stable descending sort)
+    final_results = heapq.nlargest(max_results, results, key=lambda x: x["score"])
 
     # Track this search for selection correlation
-    final_results = results[:max_results]
     set_last_search(query, final_results)
 
     return final_results
@@ -530,9 +596,128 @@ def get_pipeline_dir(project_dir: str) -> Path:
 AGENTCOCKPIT_MCP_CONFIG = Path.home() / ".agentcockpit" / "mcps.json"
 CLAUDE_CODE_CONFIG = Path.home() / ".claude.json"
 
-# MCP Connection Pool
-_mcp_connections: dict[str, "McpConnection"] = {}
-_request_counter = 0
+# MCP Connection Pool limits
+MCP_POOL_MAX_SIZE = 8  # Live MCP subprocesses kept at once (LRU evicted beyond this)
+MCP_IDLE_TIMEOUT = 600.0  # Seconds a connection may sit unused before it is stopped
+MCP_SWEEP_INTERVAL = 60.0  # Seconds between idle/dead connection sweeps
+_next_request_id = count(1).__next__  # Monotonic JSON-RPC request ids
+
+# Largest stdout line accepted from an MCP; longer frames are dropped unparsed
+MAX_FRAME_SIZE = 16 * 1024 * 1024
+
+# Bytes at each end of a dropped frame searched for its JSON-RPC id
+FRAME_ID_SCAN = 512
+
+# Top-level id of a frame: first key (or second, after "jsonrpc"), or last key
+_FRAME_HEAD_ID = re.compile(rb'\s*\{\s*(?:"jsonrpc"\s*:\s*"2\.0"\s*,\s*)?"id"\s*:\s*(-?\d+|"(?:[^"\\]|\\.)*")')
+_FRAME_TAIL_ID = re.compile(rb'"id"\s*:\s*(-?\d+|"(?:[^"\\]|\\.)*")\s*\}\s*$')
+
+
+def _frame_id(match: Optional[re.Match]) -> int | str | None:
+    """Decode the id captured by _FRAME_HEAD_ID/_FRAME_TAIL_ID, if any."""
+    return json.loads(match.group(1)) if match else None
+
+
+# Compact JSON-RPC encoder, built once (json.dumps with options builds one per call)
+_jsonrpc_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+
+# MCP handshake messages are constant apart from the request id, so they are pre-encoded
+_INIT_REQUEST_TEMPLATE = (
+    b'{"jsonrpc":"2.0","id":"init-%d","method":"initialize","params":'
+    b'{"protocolVersion":"2024-11-05","capabilities":{"tools":{}},'
+    b'"clientInfo":{"name":"pipeline-manager","version":"1.0.0"}}}\n'
+)
+_INITIALIZED_NOTIFICATION = b'{"jsonrpc":"2.0","method":"notifications/initialized"}\n'
+
+
+class McpStdioProtocol(asyncio.SubprocessProtocol):
+    """Frames newline-delimited JSON-RPC straight from the MCP's stdout pipe.
+
+    Bytes land in one persistent buffer via pipe_data_received, skipping the
+    StreamReader buffer (and its extra copy) that create_subprocess_exec adds.
+    """
+
+    def __init__(self, conn: "McpConnection"):
+        self._conn = conn
+        self._buf = bytearray()
+        self.stderr_tail: deque[bytes] = deque(maxlen=64)  # Recent stderr chunks, for diagnostics
+        self._can_write = asyncio.Event()
+        self._can_write.set()
+        self.exited = asyncio.Event()
+        self.closed = False
+        self._discarding = False  # Skipping the rest of an oversized frame
+        self._discard_tail: Optional[bytes] = None  # Its last bytes, while its id is still unknown
+
+    def pipe_data_received(self, fd: int, data: bytes):
+        if fd != 1:
+            # stderr is always drained so a noisy MCP can't block on a full pipe
+            self.stderr_tail.append(data)
+            return
+
+        if self._discarding:
+            newline = data.find(b'\n')
+            tail = self._discard_tail
+            if newline < 0:
+                if tail is not None:
+                    self._discard_tail = (tail + data[-FRAME_ID_SCAN:])[-FRAME_ID_SCAN:]
+                return
+            if tail is not None:
+                # The id wasn't at the start, so it should be the last key
+                tail = (tail + data[max(newline - FRAME_ID_SCAN, 0):newline])[-FRAME_ID_SCAN:]
+                self._conn._fail_oversized(_frame_id(_FRAME_TAIL_ID.search(tail)))
+                self._discard_tail = None
+            self._discarding = False
+            data = memoryview(data)[newline + 1:]
+
+        buf = self._buf
+        scan_from = len(buf)
+        buf += data
+        start = 0
+        newline = buf.find(b'\n', scan_from)
+        while newline >= 0:
+            self._conn._dispatch_line(buf[start:newline])
+            start = newline + 1
+            newline = buf.find(b'\n', start)
+        if start:
+            del buf[:start]
+
+        if len(buf) > MAX_FRAME_SIZE:
+            # Runaway frame: drop bytes until the next newline instead of
+            # buffering it all, and fail only the request it answers
+            frame_id = _frame_id(_FRAME_HEAD_ID.match(buf, 0, FRAME_ID_SCAN))
+            if frame_id is not None:
+                self._conn._fail_oversized(frame_id)
+            else:
+                self._discard_tail = bytes(buf[-FRAME_ID_SCAN:])
+            buf.clear()
+            self._discarding = True
+
+    def pipe_connection_lost(self, fd: int, exc: Optional[Exception]):
+        if fd == 1:
+            if self._buf:
+                self._conn._dispatch_line(self._buf)  # Flush a final unterminated line
+                self._buf.clear()
+            self._lost(exc)
+
+    def process_exited(self):
+        self._lost(None)
+        self.exited.set()
+
+    def pause_writing(self):
+        self._can_write.clear()
+
+    def resume_writing(self):
+        self._can_write.set()
+
+    async def drain(self):
+        """Wait until the stdin pipe is below its high-water mark."""
+        await self._can_write.wait()
+
+    def _lost(self, exc: Optional[Exception]):
+        if not self.closed:
+            self.closed = True
+            self._can_write.set()
+            self._conn._fail_pending(str(exc) if exc else "Connection closed")
 
 
 class McpConnection:
@@ -543,15 +728,38 @@ class McpConnection:
         self.command = command
         self.args = args
         self.env = env or {}
-        self.process: Optional[asyncio.subprocess.Process] = None
-        self._lock = asyncio.Lock()
+        self._transport: Optional[asyncio.SubprocessTransport] = None
+        self._protocol: Optional[McpStdioProtocol] = None
+        self._lock = asyncio.Lock()  # Guards process start + initialization
+        self._write_lock = asyncio.Lock()  # Guards stdin write + drain
         self._initialized = False
         self._init_request_id = 0
         self._use_headers = False  # Most MCP servers use newline-delimited JSON, not Content-Length headers
+        # In-flight requests, resolved by the protocol when the response arrives
+        self._pending: dict[Any, asyncio.Future] = {}
+        self._leases = 0  # Callers holding this connection from McpPool (see release)
+        self._retired = False  # Dropped from the pool; must not start a process again
+
+    @property
+    def running(self) -> bool:
+        """True while the subprocess is alive and its stdout is open."""
+        return self._protocol is not None and not self._protocol.closed
+
+    @property
+    def exited(self) -> bool:
+        """True if a subprocess was started and has since gone away."""
+        return self._protocol is not None and self._protocol.closed
+
+    def stderr_tail(self, max_chars: int = 2000) -> str:
+        """Return the end of the MCP's recent stderr output."""
+        if not self._protocol:
+            return ""
+        text = b"".join(self._protocol.stderr_tail).decode("utf-8", errors="replace")
+        return text[-max_chars:].strip()
 
     async def start(self):
         """Start the MCP subprocess."""
-        if self.process and self.process.returncode is None:
+        if self.running:
             return  # Already running
 
         # Build environment
@@ -560,57 +768,124 @@ class McpConnection:
         full_env.update(self.env)
 
         # Start process with stdio for JSON-RPC
-        self.process = await asyncio.create_subprocess_exec(
+        loop = asyncio.get_running_loop()
+        self._transport, self._protocol = await loop.subprocess_exec(
+            lambda: McpStdioProtocol(self),
             self.command,
             *self.args,
-            stdin=asyncio.subprocess.PIPE,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             env=full_env
         )
 
         # Reset initialization flag when starting new process
         self._initialized = False
 
-    async def _initialize(self):
-        """Perform MCP protocol initialization handshake."""
-        if self._initialized:
+    def _dispatch_line(self, line: bytearray):
+        """Resolve the pending request matching a JSON-RPC response line.
+
+        Responses are matched by id, so concurrent requests to the same MCP
+        overlap instead of serializing. Notifications are skipped.
+        """
+        line = line.strip()
+        if not line or line[0] != 0x7B:  # b'{'
+            return  # Skip empty lines and log output without a JSON parse attempt
+
+        try:
+            msg = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return  # Skip non-JSON lines (like log messages)
+
+        if not isinstance(msg, dict):
             return
+        msg_id = msg.get("id")
+        if not isinstance(msg_id, (int, str)):
+            return  # Notifications, or ids we never issue (lists/objects aren't hashable)
+        future = self._pending.get(msg_id)
+        if future and not future.done():
+            future.set_result(msg)
+
+    def _fail_oversized(self, frame_id: int | str | None):
+        """Fail the request whose response frame exceeded MAX_FRAME_SIZE.
+
+        Without an id, a single pending request must be the one; with several
+        pending, none is failed (the right one times out instead).
+        """
+        if frame_id is not None:
+            future = self._pending.get(frame_id)
+        elif len(self._pending) == 1:
+            future = next(iter(self._pending.values()))
+        else:
+            return
+        if future and not future.done():
+            future.set_exception(
+                RuntimeError(f"Response from {self.name} exceeded {MAX_FRAME_SIZE} bytes")
+            )
 
-        if not self.process or not self.process.stdin or not self.process.stdout:
-            raise RuntimeError("Process not started")
+    def _fail_pending(self, reason: str):
+        """Fail every request still waiting on this connection."""
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(RuntimeError(reason))
 
-        # Step 1: Send initialize request
-        self._init_request_id += 1
-        init_request = {
+    async def _request(self, request_id: Any, method: str, params: dict, timeout: float) -> dict:
+        """Send a JSON-RPC request and wait for its response."""
+        message = {
             "jsonrpc": "2.0",
-            "id": self._init_request_id,
-            "method": "initialize",
-            "params": {
-                "protocolVersion": "2024-11-05",
-                "capabilities": {
-                    "tools": {}
-                },
-                "clientInfo": {
-                    "name": "pipeline-manager",
-                    "version": "1.0.0"
-                }
-            }
+            "id": request_id,
+            "method": method,
+            "params": params
         }
+        return await self._request_raw(
+            request_id, _jsonrpc_encoder.encode(message).encode('utf-8') + b'\n', timeout
+        )
 
-        await self._send_message(init_request)
+    async def _request_raw(self, request_id: Any, line: bytes, timeout: float) -> dict:
+        """Send an already-encoded request line and wait for its response."""
+        if not self.running:
+            raise RuntimeError("Connection closed")
 
-        # Read messages until we get the initialize response (skip notifications)
-        init_response = None
-        for _ in range(10):  # Max 10 messages to find the response
-            msg = await self._read_message(timeout=30.0)
-            # Check if this is the response to our initialize request
-            if msg.get("id") == self._init_request_id:
-                init_response = msg
-                break
-            # Skip notifications (they don't have an id)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self._write(line)
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            self._pending.pop(request_id, None)
 
-        if init_response is None:
+    async def ensure_ready(self):
+        """Start the process and run the initialize handshake if needed."""
+        async with self._lock:
+            if not self.running:
+                if self._retired:
+                    # Outside the pool nothing would ever stop the new process
+                    raise RuntimeError(f"Connection to MCP {self.name} was closed")
+                await self.start()
+
+            if not self.running:
+                raise RuntimeError(f"Failed to start MCP {self.name}")
+
+            if not self._initialized:
+                await self._initialize()
+
+    async def _initialize(self):
+        """Perform MCP protocol initialization handshake."""
+        if self._initialized:
+            return
+
+        if not self.running:
+            raise RuntimeError("Process not started")
+
+        # Step 1: Send initialize request (notifications are skipped by the dispatcher)
+        self._init_request_id += 1
+        try:
+            init_response = await self._request_raw(
+                f"init-{self._init_request_id}",
+                _INIT_REQUEST_TEMPLATE % self._init_request_id,
+                timeout=30.0
+            )
+        except asyncio.TimeoutError:
             raise RuntimeError("No initialize response received")
 
         # Check for error in response
@@ -618,96 +893,230 @@ class McpConnection:
             raise RuntimeError(f"Initialize failed: {init_response['error']}")
 
         # Step 2: Send initialized notification (no response expected, but some servers may send one)
-        initialized_notification = {
-            "jsonrpc": "2.0",
-            "method": "notifications/initialized"
-        }
-
-        await self._send_message(initialized_notification)
+        await self._write(_INITIALIZED_NOTIFICATION)
 
         # Small delay to let server process the notification
         await asyncio.sleep(0.1)
 
         self._initialized = True
 
-    async def _send_message(self, message: dict):
-        """Send a message using newline-delimited JSON (standard MCP stdio)."""
-        if not self.process or not self.process.stdin:
+    async def _write(self, line: bytes):
+        """Write one encoded newline-terminated message to stdin."""
+        if not self.running:
             raise RuntimeError("Process not started")
 
-        body = json.dumps(message).encode('utf-8')
-        self.process.stdin.write(body + b'\n')
-        await self.process.stdin.drain()
+        async with self._write_lock:
+            self._transport.get_pipe_transport(0).write(line)
+            await self._protocol.drain()
 
-    async def _read_message(self, timeout: float = 120.0) -> dict:
-        """Read a message using newline-delimited JSON (standard MCP stdio)."""
-        if not self.process or not self.process.stdout:
-            raise RuntimeError("Process not started")
+    async def call_tool(self, tool_name: str, arguments: dict, request_id: int) -> dict:
+        """Call a tool on this MCP server."""
+        try:
+            await self.ensure_ready()
+        except Exception as e:
+            error = {"code": -1, "message": f"MCP initialization failed for {self.name}: {str(e)}"}
+            stderr = self.stderr_tail()
+            if stderr:
+                error["data"] = {"stderr": stderr}
+            return {"error": error}
 
-        while True:
-            line = await asyncio.wait_for(
-                self.process.stdout.readline(),
-                timeout=timeout
+        # Send JSON-RPC request; only the stdin write is serialized
+        try:
+            return await self._request(
+                request_id,
+                "tools/call",
+                {"name": tool_name, "arguments": arguments},
+                timeout=120.0
             )
-            if not line:
-                raise RuntimeError("Connection closed")
-
-            line_str = line.decode('utf-8').strip()
-            if not line_str:
-                continue  # Skip empty lines
+        except asyncio.TimeoutError:
+            return {"error": {"code": -1, "message": f"Timeout waiting for response from {self.name}"}}
+        except (RuntimeError, OSError) as e:
+            return {"error": {"code": -1, "message": str(e)}}
 
+    async def stop(self):
+        """Stop the MCP subprocess."""
+        self._fail_pending("Connection closed")
+        transport, protocol = self._transport, self._protocol
+        if transport is None:
+            return
+        if transport.get_returncode() is None:
+            transport.terminate()
             try:
-                return json.loads(line_str)
-            except json.JSONDecodeError:
-                # Skip non-JSON lines (like log messages)
-                continue
+                await asyncio.wait_for(protocol.exited.wait(), timeout=5.0)
+            except asyncio.TimeoutError:
+                transport.kill()
+        transport.close()
 
-    async def call_tool(self, tool_name: str, arguments: dict, request_id: int) -> dict:
-        """Call a tool on this MCP server."""
+    @property
+    def busy(self) -> bool:
+        """True while a caller holds this connection or requests are waiting on it."""
+        return self._leases > 0 or bool(self._pending)
+
+    def release(self):
+        """Return a connection obtained from get_mcp_connection to the pool."""
+        self._leases -= 1
+
+
+class McpPool:
+    """Bounded pool of MCP connections with idle and dead-process eviction.
+
+    Connections are created lazily by get_mcp_connection. get and add lease
+    the returned connection until its release(); leased connections are never
+    evicted, so the pool may briefly exceed max_size. A sweeper task, started
+    on first use, stops connections idle longer than idle_timeout or whose
+    subprocess has exited.
+    """
+
+    def __init__(self, max_size: int, idle_timeout: float, sweep_interval: float):
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = sweep_interval
+        self._lock = asyncio.Lock()
+        # name -> (connection, last_used monotonic time); insertion order is LRU order
+        self._entries: dict[str, tuple[McpConnection, float]] = {}
+        self._sweeper: Optional[asyncio.Task] = None
+
+    async def get(self, name: str) -> Optional[McpConnection]:
+        """Lease a pooled connection and mark it as most recently used."""
         async with self._lock:
-            if not self.process or self.process.returncode is not None:
-                await self.start()
+            entry = self._entries.pop(name, None)
+            if entry is None:
+                return None
+            conn = entry[0]
+            self._entries[name] = (conn, time.monotonic())
+            conn._leases += 1
+            return conn
+
+    async def add(self, name: str, conn: McpConnection) -> McpConnection:
+        """Add and lease a connection, evicting idle LRU ones over max_size.
+
+        If another caller registered name first, that connection is leased
+        and returned instead, so concurrent first calls share one subprocess.
+        """
+        evicted = []
+        async with self._lock:
+            existing = self._entries.pop(name, None)
+            if existing is not None:
+                self._entries[name] = (existing[0], time.monotonic())
+                existing[0]._leases += 1
+                return existing[0]
+            self._entries[name] = (conn, time.monotonic())
+            conn._leases += 1
+            evicted = self._evict_over_capacity()
+            self._ensure_sweeper()
+
+        for old_conn in evicted:
+            await self._stop(old_conn)
+        return conn
+
+    async def sweep(self) -> list[str]:
+        """Stop idle, dead and over-capacity connections. Returns the evicted names."""
+        now = time.monotonic()
+        evicted = []
+        async with self._lock:
+            for name, (conn, last_used) in list(self._entries.items()):
+                if conn.busy:
+                    continue  # A leaseholder restarts a dead process in place
+                if conn.exited or now - last_used > self.idle_timeout:
+                    del self._entries[name]
+                    conn._retired = True
+                    evicted.append(conn)
+            names = [conn.name for conn in evicted]
+            over = self._evict_over_capacity()
+            evicted += over
+            names += [conn.name for conn in over]
+
+        for conn in evicted:
+            await self._stop(conn)
+        return names
+
+    def _evict_over_capacity(self) -> list[McpConnection]:
+        """Drop least recently used idle connections beyond max_size (lock held)."""
+        evicted = []
+        for name in list(self._entries):
+            if len(self._entries) <= self.max_size:
+                break
+            conn = self._entries[name][0]
+            if conn.busy:
+                continue
+            del self._entries[name]
+            conn._retired = True
+            evicted.append(conn)
+        return evicted
 
-            if not self.process or not self.process.stdin or not self.process.stdout:
-                return {"error": {"code": -1, "message": f"Failed to start MCP {self.name}"}}
+    async def close_all(self) -> list[str]:
+        """Stop every pooled connection. Returns the names that stopped cleanly."""
+        async with self._lock:
+            entries = list(self._entries.items())
+            self._entries.clear()
+            for _, (conn, _) in entries:
+                conn._retired = True
+            if self._sweeper:
+                self._sweeper.cancel()
+                self._sweeper = None
+
+        # Stopped concurrently: shutdown takes the slowest stop, not the sum
+        outcomes = await asyncio.gather(
+            *(conn.stop() for _, (conn, _) in entries),
+            return_exceptions=True
+        )
+        return [
+            name for (name, _), outcome in zip(entries, outcomes)
+            if not isinstance(outcome, BaseException)
+        ]
 
-            # Ensure MCP protocol initialization is done
-            if not self._initialized:
-                try:
-                    await self._initialize()
-                except Exception as e:
-                    return {"error": {"code": -1, "message": f"MCP initialization failed for {self.name}: {str(e)}"}}
-
-            # Send JSON-RPC request
-            request = {
-                "jsonrpc": "2.0",
-                "id": request_id,
-                "method": "tools/call",
-                "params": {
-                    "name": tool_name,
-                    "arguments": arguments
-                }
-            }
+    def _ensure_sweeper(self):
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep_loop())
 
+    async def _sweep_loop(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval)
             try:
-                await self._send_message(request)
-                response = await self._read_message(timeout=120.0)
-                return response
-            except asyncio.TimeoutError:
-                return {"error": {"code": -1, "message": f"Timeout waiting for response from {self.name}"}}
-            except json.JSONDecodeError as e:
-                return {"error": {"code": -1, "message": f"Invalid JSON from {self.name}: {e}"}}
-            except RuntimeError as e:
-                return {"error": {"code": -1, "message": str(e)}}
+                await self.sweep()
+            except Exception:
+                pass
+
+    @staticmethod
+    async def _stop(conn: McpConnection):
+        try:
+            await conn.stop()
+        except Exception:
+            pass
+
+
+_mcp_pool = McpPool(MCP_POOL_MAX_SIZE, MCP_IDLE_TIMEOUT, MCP_SWEEP_INTERVAL)
 
-    async def stop(self):
-        """Stop the MCP subprocess."""
-        if self.process and self.process.returncode is None:
-            self.process.terminate()
-            try:
-                await asyncio.wait_for(self.process.wait(), timeout=5.0)
-            except asyncio.TimeoutError:
-                self.process.kill()
+
+# Parsed MCP configs: path -> ((st_mtime_ns, st_size), configs)
+_mcp_config_cache: dict[Path, tuple[tuple[int, int], dict[str, dict]]] = {}
+
+
+def _load_mcp_config_file(path: Path, extract) -> Optional[dict[str, dict]]:
+    """Parse an MCP config file through extract(), reusing it until it changes.
+
+    Returns None if the file is missing or unreadable.
+    """
+    try:
+        return stat_cached(_mcp_config_cache, path, lambda p: extract(json.loads(p.read_bytes())))
+    except Exception:
+        return None
+
+
+def _extract_agentcockpit_mcps(data: dict) -> dict[str, dict]:
+    mcp_servers = data.get("mcpServers", {})
+    # AgentCockpit format: {"name": {"name": ..., "config": {...}}}
+    # We need to extract the config from each entry
+    result = {}
+    for name, entry in mcp_servers.items():
+        if isinstance(entry, dict):
+            # Check if this is AgentCockpit format (has 'config' key)
+            if "config" in entry:
+                result[name] = entry["config"]
+            else:
+                # Fallback to treating entry as config directly
+                result[name] = entry
+    return result
 
 
 def load_mcp_configs() -> dict[str, dict]:
@@ -718,48 +1127,30 @@ def load_mcp_configs() -> dict[str, dict]:
     2. ~/.claude.json (Claude Code config, fallback)
 
     The AgentCockpit config has a different structure with nested 'config' keys.
+    Parsed files are cached until their mtime or size changes; callers must
+    not mutate the returned dict.
     """
     # Try AgentCockpit config first (centralized)
-    try:
-        if AGENTCOCKPIT_MCP_CONFIG.exists():
-            data = json.loads(AGENTCOCKPIT_MCP_CONFIG.read_text())
-            mcp_servers = data.get("mcpServers", {})
-            # AgentCockpit format: {"name": {"name": ..., "config": {...}}}
-            # We need to extract the config from each entry
-            result = {}
-            for name, entry in mcp_servers.items():
-                if isinstance(entry, dict):
-                    # Check if this is AgentCockpit format (has 'config' key)
-                    if "config" in entry:
-                        result[name] = entry["config"]
-                    else:
-                        # Fallback to treating entry as config directly
-                        result[name] = entry
-            if result:
-                return result
-    except Exception as e:
-        pass
+    result = _load_mcp_config_file(AGENTCOCKPIT_MCP_CONFIG, _extract_agentcockpit_mcps)
+    if result:
+        return result
 
     # Fallback to Claude Code config
-    try:
-        if CLAUDE_CODE_CONFIG.exists():
-            config = json.loads(CLAUDE_CODE_CONFIG.read_text())
-            return config.get("mcpServers", {})
-    except Exception:
-        pass
+    result = _load_mcp_config_file(CLAUDE_CODE_CONFIG, lambda config: config.get("mcpServers", {}))
+    if result is not None:
+        return result
 
     return {}
 
 
 async def get_mcp_connection(mcp_name: str) -> Optional[McpConnection]:
-    """Get or create an MCP connection."""
-    global _mcp_connections
-
-    if mcp_name in _mcp_connections:
-        return _mcp_connections[mcp_name]
+    """Get or create an MCP connection, leased until conn.release()."""
+    conn = await _mcp_pool.get(mcp_name)
+    if conn is not None:
+        return conn
 
     # Load config for this MCP
-    configs = load_mcp_configs()
+    configs = await asyncio.to_thread(load_mcp_configs)
     if mcp_name not in configs:
         return None
 
@@ -771,11 +1162,56 @@ async def get_mcp_connection(mcp_name: str) -> Optional[McpConnection]:
     if not command:
         return None
 
-    # Create connection
-    conn = McpConnection(mcp_name, command, args, env)
-    _mcp_connections[mcp_name] = conn
+    # Create connection (not started yet, so losing a registration race is free)
+    return await _mcp_pool.add(mcp_name, McpConnection(mcp_name, command, args, env))
+
 
-    return conn
+MCP_STARTUP_CONCURRENCY = 4  # MCP servers started at once by a warm-up or index refresh
+
+# Running warm-up tasks (referenced so they aren't garbage collected mid-run)
+_warmup_tasks: set[asyncio.Task] = set()
+
+
+async def _warm_up_mcps(mcp_names: list[str]):
+    """Start and initialize MCP connections ahead of their first tool call."""
+    semaphore = asyncio.Semaphore(MCP_STARTUP_CONCURRENCY)
+
+    async def warm(name: str):
+        async with semaphore:
+            conn = None
+            try:
+                conn = await get_mcp_connection(name)
+                if conn:
+                    await conn.ensure_ready()
+            except Exception:
+                pass  # The real call reports the failure
+            finally:
+                if conn:
+                    conn.release()
+
+    await asyncio.gather(*(warm(name) for name in mcp_names))
+
+
+def _schedule_warmup(mcp_names: list[str]):
+    """Warm up MCPs in the background without delaying the calling tool.
+
+    Only spawns processes; callers pass node data they already loaded, so the
+    task never reads or writes state files. Nodes allowing "*" are not warmed
+    (that would spawn every configured MCP); at most MCP_POOL_MAX_SIZE are started.
+    """
+    if not mcp_names or "*" in mcp_names:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # Not called from the server's event loop
+
+    async def run():
+        await _warm_up_mcps(mcp_names[:MCP_POOL_MAX_SIZE])
+
+    task = loop.create_task(run())
+    _warmup_tasks.add(task)
+    task.add_done_callback(_warmup_tasks.discard)
 
 
 # DEPRECATED: load_state, save_state, load_steps, load_config removed
@@ -812,6 +1248,10 @@ def set_session(project_dir: str, session_id: str | None = None) -> dict:
     # Validate project exists
     pipeline_dir = get_pipeline_dir(project_dir)
 
+    # Start the current node's MCPs now so the first execute_mcp_tool
+    # doesn't pay for the spawn + initialize handshake
+    _schedule_warmup(_current_node_mcps(project_dir))
+
     return {
         "success": True,
         "session_id": sid,
@@ -830,23 +1270,28 @@ def get_enforcer_config_file(project_dir: str) -> Path:
     return get_project_state_dir(project_dir) / "config.json"
 
 
+# Parsed enforcer configs: path -> ((st_mtime_ns, st_size), config)
+_enforcer_config_cache: dict[Path, tuple[tuple[int, int], dict]] = {}
+
+
 def load_enforcer_config(project_dir: str) -> dict:
-    """Load enforcer configuration from config.json."""
+    """Load enforcer configuration from config.json.
+
+    The parsed file is cached until its mtime or size changes; callers get
+    a copy they may modify.
+    """
     config_file = get_enforcer_config_file(project_dir)
-    if config_file.exists():
-        try:
-            return json.loads(config_file.read_text())
-        except Exception:
-            pass
-    return {"enforcer_enabled": True}
+    try:
+        return dict(stat_cached(_enforcer_config_cache, config_file, lambda p: json.loads(p.read_text())))
+    except Exception:
+        return {"enforcer_enabled": True}
 
 
 def save_enforcer_config(project_dir: str, config: dict):
     """Save enforcer configuration to config.json."""
     config_file = get_enforcer_config_file(project_dir)
-    config_file.parent.mkdir(parents=True, exist_ok=True)
     config["last_updated"] = datetime.now().isoformat()
-    config_file.write_text(json.dumps(config, indent=2))
+    write_atomic(config_file, json.dumps(config, indent=2))
 
 
 @mcp.tool()
@@ -902,79 +1347,168 @@ def get_pipelines_library_dir(project_dir: str | None = None) -> Path:
 # Use graph_traverse, graph_check_tool, graph_check_phrase instead
 
 
-@mcp.tool()
-async def execute_mcp_tool(
-    mcp_name: str,
-    tool_name: str,
-    arguments: dict[str, Any],
-    project_dir: str | None = None,
-    session_id: str | None = None
-) -> dict:
-    """Execute any available MCP tool through the graph pipeline proxy.
+# Opt-in execute_mcp_tool response cache: key -> (expires_at monotonic, raw JSON-RPC response)
+_tool_call_cache: dict[str, tuple[float, dict]] = {}
+TOOL_CALL_CACHE_MAX = 256  # Entries kept; oldest inserted are evicted first
 
-    This is the universal gateway for calling MCP tools. The available
-    tools depend on the current graph node. Use graph_status to see
-    which MCPs are enabled for the current node.
 
-    The tool spawns MCP servers on-demand and maintains a connection pool
-    for efficient reuse. MCP configurations are read from ~/.claude.json.
+def _tool_call_cache_key(mcp_name: str, tool_name: str, arguments: dict) -> str:
+    """Stable key for a tool call: blake2b over MCP, tool and canonical arguments."""
+    canonical = json.dumps(arguments, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(
+        f"{mcp_name}:{tool_name}:{canonical}".encode("utf-8"), digest_size=16
+    ).hexdigest()
 
-    After execution, reports any available transitions that this tool
-    triggers (but does NOT auto-advance - use graph_traverse for that).
 
-    Args:
-        mcp_name: Name of the MCP server (e.g., "Context7", "sequential-thinking")
-        tool_name: Name of the tool to execute (e.g., "get-library-docs", "sequentialthinking")
-        arguments: Tool arguments as a dictionary matching the tool's schema
-        project_dir: Absolute path to the project directory (optional after set_session)
-        session_id: Optional session ID for parallel session isolation
+def _get_cached_tool_call(key: str) -> Optional[dict]:
+    entry = _tool_call_cache.get(key)
+    if entry is None:
+        return None
+    if entry[0] <= time.monotonic():
+        del _tool_call_cache[key]
+        return None
+    return entry[1]
 
-    Returns:
-        The tool execution result, plus any available graph transitions
 
-    Example:
-        # First set session (once)
-        set_session(project_dir="/path/to/project")
+def _store_cached_tool_call(key: str, ttl: float, response: dict):
+    _tool_call_cache.pop(key, None)
+    _tool_call_cache[key] = (time.monotonic() + ttl, response)
+    while len(_tool_call_cache) > TOOL_CALL_CACHE_MAX:
+        del _tool_call_cache[next(iter(_tool_call_cache))]
 
-        # Then execute tools without project_dir
-        execute_mcp_tool(
-            mcp_name="Context7",
-            tool_name="get-library-docs",
-            arguments={"context7CompatibleLibraryID": "/vercel/next.js", "topic": "routing"}
-        )
-    """
-    global _request_counter
 
-    resolved_dir, sid = resolve_project_dir(project_dir, session_id)
+def _is_tool_error(response: dict) -> bool:
+    """True for MCP tool-level failures (result.isError), which are never cached."""
+    result = response.get("result")
+    return isinstance(result, dict) and bool(result.get("isError"))
 
-    # Record tool selection for weight learning (if this tool was in recent search)
-    check_and_record_selection(mcp_name, tool_name)
 
-    # 1. Load graph state (if graph exists)
-    graph_file = get_graph_file(resolved_dir)
-    current_node = None
-    enabled_mcps = ["*"]
-    graph = None
-    graph_state = None
+# Characters of text content kept inline when a result is spilled to disk
+SPILL_PREVIEW_CHARS = 2000
+
+# Spilled results kept per project; the oldest are deleted beyond this
+SPILL_MAX_FILES = 50
 
-    if graph_file.exists():
+
+def _prune_spilled(responses_dir: Path):
+    """Delete the oldest spilled results so at most SPILL_MAX_FILES remain."""
+    files = []
+    for path in responses_dir.glob("*.json"):
         try:
-            graph = load_graph_from_file(graph_file)
-            graph_state = load_graph_state(resolved_dir)
-
-            # Initialize state if empty
-            if not graph_state.current_nodes:
-                graph_state = initialize_graph_state(
-                    resolved_dir, graph, graph.metadata.get('name', 'unnamed')
-                )
-
-            current_node_id = graph_state.get_current_node()
-            current_node = graph.nodes.get(current_node_id)
-            if current_node:
-                enabled_mcps = current_node.mcps_enabled
-        except Exception:
-            pass  # Fall back to allowing all MCPs
+            files.append((path.stat().st_mtime_ns, path))
+        except OSError:
+            pass  # Removed by a concurrent prune
+    files.sort()
+    for _, path in files[:-SPILL_MAX_FILES]:
+        path.unlink(missing_ok=True)
+
 
+def _spill_large_result(tool_result: Any, project_dir: str, mcp_name: str, tool_name: str, max_inline_bytes: int) -> Any:
+    """Write a result larger than max_inline_bytes to disk and return a handle.
+
+    MCP tool results are a single JSON-RPC message, so they can't be streamed
+    to the client; instead the payload goes to
+    {project}/.claude/pipeline/responses/ and the client gets its path, size
+    and a text preview to Read selectively.
+    """
+    if max_inline_bytes <= 0 or not isinstance(tool_result, dict) or tool_result.get("error") is True:
+        return tool_result
+
+    transitions = tool_result.get("_graph_transitions_available")
+    payload = {k: v for k, v in tool_result.items() if k != "_graph_transitions_available"}
+    text = json.dumps(payload, indent=2, ensure_ascii=False)
+    body = text.encode("utf-8")
+    if len(body) <= max_inline_bytes:
+        return tool_result
+
+    digest = hashlib.blake2b(body, digest_size=8).hexdigest()
+    safe_name = re.sub(r"[^\w.-]", "_", f"{mcp_name}-{tool_name}")
+    responses_dir = Path(project_dir) / ".claude" / "pipeline" / "responses"
+    path = responses_dir / f"{safe_name}-{digest}.json"
+    try:
+        os.utime(path)  # Same result again: refresh it so pruning keeps it
+    except FileNotFoundError:
+        write_atomic(path, text)
+        _prune_spilled(responses_dir)
+
+    texts = []
+    size = 0
+    for item in payload.get("content") or []:
+        if isinstance(item, dict) and item.get("type") == "text":
+            texts.append(item.get("text", ""))
+            size += len(texts[-1])
+            if size >= SPILL_PREVIEW_CHARS:
+                break
+
+    handle = {
+        "spilled": True,
+        "path": str(path),
+        "bytes": len(body),
+        "preview": "\n".join(texts)[:SPILL_PREVIEW_CHARS],
+        "hint": "Full result written to path; use Read (with offset/limit) or grep on it"
+    }
+    if transitions:
+        handle["_graph_transitions_available"] = transitions
+    return handle
+
+
+def _load_proxy_context(project_dir: str) -> tuple[Optional[Graph], Optional[GraphState], Optional[Node], list[str]]:
+    """Load graph, state, current node and its enabled MCPs for the proxy.
+
+    Without a (valid) graph all MCPs are allowed: (None, None, None, ["*"]).
+    """
+    graph_file = get_graph_file(project_dir)
+    if not graph_file.exists():
+        return None, None, None, ["*"]
+
+    try:
+        graph = _load_graph_cached(graph_file)
+        graph_state = load_graph_state(project_dir)
+
+        # Initialize state if empty
+        if not graph_state.current_nodes:
+            graph_state = initialize_graph_state(
+                project_dir, graph, graph.metadata.get('name', 'unnamed')
+            )
+
+        current_node = graph.nodes.get(graph_state.get_current_node())
+        enabled_mcps = current_node.mcps_enabled if current_node else ["*"]
+        return graph, graph_state, current_node, enabled_mcps
+    except Exception:
+        return None, None, None, ["*"]  # Fall back to allowing all MCPs
+
+
+def _current_node_mcps(project_dir: str) -> list[str]:
+    """MCPs enabled in the current node, read-only (no state is initialized).
+
+    Without state yet, uses the start node that initialization would pick.
+    Returns an empty list when there is no (valid) graph.
+    """
+    graph_file = get_graph_file(project_dir)
+    if not graph_file.exists():
+        return []
+
+    try:
+        graph = _load_graph_cached(graph_file)
+        current_id = load_graph_state(project_dir).get_current_node()
+        current_node = graph.nodes.get(current_id) if current_id else graph.get_start_node()
+    except Exception:
+        return []
+    return current_node.mcps_enabled if current_node else []
+
+
+async def _execute_in_context(
+    mcp_name: str,
+    tool_name: str,
+    arguments: dict[str, Any],
+    sid: str,
+    graph: Optional[Graph],
+    graph_state: Optional[GraphState],
+    current_node: Optional[Node],
+    enabled_mcps: list[str],
+    cache_ttl: int = 0
+) -> dict:
+    """Run steps 2-7 of execute_mcp_tool against an already loaded graph context."""
     # 2. Validate MCP is allowed in current node
     if "*" not in enabled_mcps and mcp_name not in enabled_mcps:
         return {
@@ -985,35 +1519,44 @@ async def execute_mcp_tool(
             "hint": "Use graph_status() to see available MCPs for current node"
         }
 
-    # 3. Get or create MCP connection
-    conn = await get_mcp_connection(mcp_name)
-    if not conn:
-        # Check if MCP exists in config
-        configs = load_mcp_configs()
-        if mcp_name not in configs:
+    # 3. Serve opted-in repeat calls from the response cache
+    cache_key = _tool_call_cache_key(mcp_name, tool_name, arguments) if cache_ttl > 0 else None
+    result = _get_cached_tool_call(cache_key) if cache_key else None
+
+    if result is None:
+        # 4. Get or create MCP connection
+        conn = await get_mcp_connection(mcp_name)
+        if not conn:
+            # Check if MCP exists in config
+            configs = await asyncio.to_thread(load_mcp_configs)
+            if mcp_name not in configs:
+                return {
+                    "error": True,
+                    "message": f"MCP '{mcp_name}' not found in ~/.claude.json",
+                    "available_mcps": list(configs.keys()),
+                    "hint": "Add the MCP configuration to ~/.claude.json first"
+                }
             return {
                 "error": True,
-                "message": f"MCP '{mcp_name}' not found in ~/.claude.json",
-                "available_mcps": list(configs.keys()),
-                "hint": "Add the MCP configuration to ~/.claude.json first"
+                "message": f"Failed to create connection to MCP '{mcp_name}'",
+                "hint": "Check the MCP command configuration in ~/.claude.json"
             }
-        return {
-            "error": True,
-            "message": f"Failed to create connection to MCP '{mcp_name}'",
-            "hint": "Check the MCP command configuration in ~/.claude.json"
-        }
 
-    # 4. Execute the tool
-    _request_counter += 1
-    try:
-        result = await conn.call_tool(tool_name, arguments, _request_counter)
-    except Exception as e:
-        return {
-            "error": True,
-            "message": f"Error executing tool on {mcp_name}: {str(e)}"
-        }
+        # 5. Execute the tool
+        try:
+            result = await conn.call_tool(tool_name, arguments, _next_request_id())
+        except Exception as e:
+            return {
+                "error": True,
+                "message": f"Error executing tool on {mcp_name}: {str(e)}"
+            }
+        finally:
+            conn.release()
+
+        if cache_key and "error" not in result and not _is_tool_error(result):
+            _store_cached_tool_call(cache_key, cache_ttl, result)
 
-    # 5. Check for available graph transitions (but don't auto-advance)
+    # 6. Check for available graph transitions (but don't auto-advance)
     available_transitions = None
     if graph and graph_state:
         trigger_value = {'mcp': mcp_name, 'tool': tool_name}
@@ -1032,14 +1575,17 @@ async def execute_mcp_tool(
                 "hint": "Use graph_traverse(edge_id) to advance"
             }
 
-    # 6. Return result
+    # 7. Return result
     if "error" in result:
         error_info = result.get("error", {})
         if isinstance(error_info, dict):
-            return {
+            response = {
                 "error": True,
                 "message": error_info.get("message", str(error_info))
             }
+            if "data" in error_info:
+                response["data"] = error_info["data"]
+            return response
         return {
             "error": True,
             "message": str(error_info)
@@ -1047,10 +1593,10 @@ async def execute_mcp_tool(
 
     tool_result = result.get("result", result)
 
-    # Include available transitions if any
+    # Include available transitions if any (copy: the result may be cached)
     if available_transitions:
         if isinstance(tool_result, dict):
-            tool_result["_graph_transitions_available"] = available_transitions
+            tool_result = {**tool_result, "_graph_transitions_available": available_transitions}
         else:
             tool_result = {
                 "result": tool_result,
@@ -1060,6 +1606,167 @@ async def execute_mcp_tool(
     return tool_result
 
 
+@mcp.tool()
+async def execute_mcp_tool(
+    mcp_name: str,
+    tool_name: str,
+    arguments: dict[str, Any],
+    project_dir: str | None = None,
+    session_id: str | None = None,
+    cache_ttl: int = 0,
+    max_inline_bytes: int = 0
+) -> dict:
+    """Execute any available MCP tool through the graph pipeline proxy.
+
+    This is the universal gateway for calling MCP tools. The available
+    tools depend on the current graph node. Use graph_status to see
+    which MCPs are enabled for the current node.
+
+    The tool spawns MCP servers on-demand and maintains a connection pool
+    for efficient reuse. MCP configurations are read from ~/.claude.json.
+
+    After execution, reports any available transitions that this tool
+    triggers (but does NOT auto-advance - use graph_traverse for that).
+
+    Args:
+        mcp_name: Name of the MCP server (e.g., "Context7", "sequential-thinking")
+        tool_name: Name of the tool to execute (e.g., "get-library-docs", "sequentialthinking")
+        arguments: Tool arguments as a dictionary matching the tool's schema
+        project_dir: Absolute path to the project directory (optional after set_session)
+        session_id: Optional session ID for parallel session isolation
+        cache_ttl: Seconds to reuse a successful result for identical calls
+            (same MCP, tool and arguments). 0 disables caching; only use it
+            for idempotent reads such as docs lookups or listings.
+        max_inline_bytes: If > 0, results whose JSON exceeds this size are
+            written under .claude/pipeline/responses/ and returned as a
+            {"spilled", "path", "bytes", "preview"} handle instead
+            (only the newest SPILL_MAX_FILES files are kept).
+
+    Returns:
+        The tool execution result, plus any available graph transitions
+
+    Example:
+        # First set session (once)
+        set_session(project_dir="/path/to/project")
+
+        # Then execute tools without project_dir
+        execute_mcp_tool(
+            mcp_name="Context7",
+            tool_name="get-library-docs",
+            arguments={"context7CompatibleLibraryID": "/vercel/next.js", "topic": "routing"}
+        )
+    """
+    resolved_dir, sid = resolve_project_dir(project_dir, session_id)
+
+    # Record tool selection for weight learning (if this tool was in recent search)
+    check_and_record_selection(mcp_name, tool_name)
+
+    # 1. Load graph state (if graph exists), off the event loop so disk I/O
+    # doesn't stall in-flight calls to other MCPs
+    graph, graph_state, current_node, enabled_mcps = await asyncio.to_thread(
+        _load_proxy_context, resolved_dir
+    )
+
+    tool_result = await _execute_in_context(
+        mcp_name, tool_name, arguments, sid,
+        graph, graph_state, current_node, enabled_mcps, cache_ttl
+    )
+    if max_inline_bytes > 0:
+        tool_result = await asyncio.to_thread(
+            _spill_large_result, tool_result, resolved_dir, mcp_name, tool_name, max_inline_bytes
+        )
+    return tool_result
+
+
+def _call_number(call: dict[str, Any], key: str) -> float:
+    """Read an optional numeric field of a batch call (numeric strings allowed).
+
+    execute_mcp_tool gets these fields validated by its signature; batch
+    calls are plain dicts, so they are checked here.
+
+    Raises:
+        ValueError: If the value is not a finite number
+    """
+    value = number = call.get(key)
+    if value is None:
+        return 0
+    if isinstance(value, str):
+        try:
+            number = float(value)
+        except ValueError:
+            pass
+    if isinstance(number, (int, float)) and not isinstance(number, bool) and math.isfinite(number):
+        return number
+    raise ValueError(f"{key} must be a number, got {value!r}")
+
+
+@mcp.tool()
+async def execute_mcp_tools_batch(
+    calls: list[dict[str, Any]],
+    project_dir: str | None = None,
+    session_id: str | None = None
+) -> dict:
+    """Execute several independent MCP tool calls concurrently.
+
+    Same gating, caching and transition reporting as execute_mcp_tool, but
+    the graph state is loaded once and the calls run in parallel, so the
+    wall time is the slowest call rather than the sum.
+
+    Args:
+        calls: List of {"mcp_name", "tool_name", "arguments", "cache_ttl"?,
+            "max_inline_bytes"?}
+        project_dir: Absolute path to the project directory (optional after set_session)
+        session_id: Optional session ID for parallel session isolation
+
+    Returns:
+        Results in the same order as calls
+    """
+    resolved_dir, sid = resolve_project_dir(project_dir, session_id)
+
+    for call in calls:
+        check_and_record_selection(call.get("mcp_name", ""), call.get("tool_name", ""))
+
+    graph, graph_state, current_node, enabled_mcps = await asyncio.to_thread(
+        _load_proxy_context, resolved_dir
+    )
+
+    async def run(call: dict[str, Any]) -> dict:
+        if not call.get("mcp_name") or not call.get("tool_name"):
+            return {"error": True, "message": "Each call needs mcp_name and tool_name"}
+        try:
+            cache_ttl = _call_number(call, "cache_ttl")
+            max_inline_bytes = _call_number(call, "max_inline_bytes")
+        except ValueError as e:
+            return {"error": True, "message": str(e)}
+        tool_result = await _execute_in_context(
+            call["mcp_name"], call["tool_name"], call.get("arguments") or {}, sid,
+            graph, graph_state, current_node, enabled_mcps, cache_ttl
+        )
+        if max_inline_bytes > 0:
+            tool_result = await asyncio.to_thread(
+                _spill_large_result, tool_result, resolved_dir,
+                call["mcp_name"], call["tool_name"], max_inline_bytes
+            )
+        return tool_result
+
+    outcomes = await asyncio.gather(*(run(call) for call in calls), return_exceptions=True)
+
+    results = []
+    for call, outcome in zip(calls, outcomes):
+        if isinstance(outcome, BaseException):
+            outcome = {
+                "error": True,
+                "message": f"Error executing tool on {call.get('mcp_name')}: {str(outcome)}"
+            }
+        results.append(outcome)
+
+    return {
+        "session_id": sid,
+        "results": results,
+        "project_dir": resolved_dir
+    }
+
+
 @mcp.tool()
 def search_tools(
     query: str,
@@ -1182,55 +1889,54 @@ async def refresh_tool_index(mcp_name: str | None = None) -> dict:
     """
     global _tool_index
 
-    configs = load_mcp_configs()
+    configs = await asyncio.to_thread(load_mcp_configs)
     indexed_count = 0
     errors = []
 
     mcps_to_index = [mcp_name] if mcp_name else list(configs.keys())
 
-    for name in mcps_to_index:
+    # MCPs are listed concurrently (bounded): the refresh takes the slowest
+    # MCP, not the sum of all of them
+    semaphore = asyncio.Semaphore(MCP_STARTUP_CONCURRENCY)
+
+    async def list_tools(name: str) -> list[dict] | str:
+        """Return the MCP's tools, or an error message."""
         if name not in configs:
-            errors.append(f"MCP '{name}' not found in config")
-            continue
+            return f"MCP '{name}' not found in config"
 
+        async with semaphore:
+            conn = None
+            try:
+                conn = await get_mcp_connection(name)
+                if not conn:
+                    return f"Could not connect to {name}"
+
+                # Get tools list via MCP protocol
+                await conn.ensure_ready()
+                response = await conn._request(_next_request_id(), "tools/list", {}, timeout=30.0)
+
+                if "error" in response:
+                    return f"{name}: {response['error']}"
+                return (response.get("result") or {}).get("tools") or []
+            except Exception as e:
+                return f"{name}: {str(e)}"
+            finally:
+                if conn:
+                    conn.release()
+
+    outcomes = await asyncio.gather(*(list_tools(name) for name in mcps_to_index))
+
+    for name, outcome in zip(mcps_to_index, outcomes):
+        if isinstance(outcome, str):
+            errors.append(outcome)
+            continue
         try:
-            conn = await get_mcp_connection(name)
-            if not conn:
-                errors.append(f"Could not connect to {name}")
-                continue
-
-            # Get tools list via MCP protocol
-            global _request_counter
-            _request_counter += 1
-
-            # Send tools/list request
-            if not conn.process or conn.process.returncode is not None:
-                await conn.start()
-
-            if not conn._initialized:
-                await conn._initialize()
-
-            request = {
-                "jsonrpc": "2.0",
-                "id": _request_counter,
-                "method": "tools/list",
-                "params": {}
-            }
-
-            await conn._send_message(request)
-            response = await conn._read_message(timeout=30.0)
-
-            if "error" in response:
-                errors.append(f"{name}: {response['error']}")
-                continue
-
-            tools = response.get("result", {}).get("tools", [])
-            indexed = build_tool_index(name, tools)
-            _tool_index[name] = indexed
-            indexed_count += len(indexed)
-
+            indexed = build_tool_index(name, outcome)
         except Exception as e:
             errors.append(f"{name}: {str(e)}")
+            continue
+        _tool_index[name] = indexed
+        indexed_count += len(indexed)
 
     return {
         "success": len(errors) == 0,
@@ -1247,17 +1953,7 @@ async def close_mcp_connections() -> dict:
     Use this to clean up resources when done with MCP tools.
     Connections will be re-established on next use.
     """
-    global _mcp_connections
-
-    closed = []
-    for name, conn in _mcp_connections.items():
-        try:
-            await conn.stop()
-            closed.append(name)
-        except Exception:
-            pass
-
-    _mcp_connections.clear()
+    closed = await _mcp_pool.close_all()
 
     return {
         "success": True,
@@ -1270,6 +1966,22 @@ async def close_mcp_connections() -> dict:
 # Graph Pipeline Functions (v2.0 - Directed Graph Engine)
 # ============================================================================
 
+# Parsed active graphs, reused while graph.yaml is unchanged so memoized
+# response fragments (edges info, Mermaid body) survive across tool calls.
+# Key: graph file path, Value: ((mtime_ns, size), Graph)
+_active_graph_cache: dict[Path, tuple[tuple[int, int], Graph]] = {}
+
+
+def _load_graph_cached(graph_file: Path) -> Graph:
+    """Load a graph file, reusing the parsed Graph while the file is unchanged.
+
+    Raises:
+        FileNotFoundError: If the graph file doesn't exist
+        GraphParseError: If parsing fails
+    """
+    return stat_cached(_active_graph_cache, graph_file, load_graph_from_file)
+
+
 def _load_active_graph(project_dir: str) -> tuple[Graph, GraphState]:
     """Load active graph and state for a project.
 
@@ -1280,10 +1992,11 @@ def _load_active_graph(project_dir: str) -> tuple[Graph, GraphState]:
         ValueError: If no graph is configured
     """
     graph_file = get_graph_file(project_dir)
-    if not graph_file.exists():
+    try:
+        graph = _load_graph_cached(graph_file)
+    except FileNotFoundError:
         raise ValueError(f"No graph.yaml found at {graph_file}")
 
-    graph = load_graph_from_file(graph_file)
     state = load_graph_state(project_dir)
 
     # Initialize state if empty
@@ -1295,7 +2008,11 @@ def _load_active_graph(project_dir: str) -> tuple[Graph, GraphState]:
 
 
 @mcp.tool()
-def graph_status(project_dir: str | None = None, session_id: str | None = None) -> dict:
+def graph_status(
+    project_dir: str | None = None,
+    session_id: str | None = None,
+    detailed: bool = True
+) -> dict:
     """Get current graph pipeline status: current node, available edges, visits.
 
     Returns the current node, outgoing edges sorted by priority,
@@ -1304,6 +2021,8 @@ def graph_status(project_dir: str | None = None, session_id: str | None = None)
     Args:
         project_dir: Absolute path to the project directory (optional after set_session)
         session_id: Optional session ID for parallel session isolation
+        detailed: If False, return only current node, transitions and last activity
+            (skips edges, warnings and the enforcer config read - for polling)
     """
     resolved_dir, sid = resolve_project_dir(project_dir, session_id)
 
@@ -1328,22 +2047,22 @@ def graph_status(project_dir: str | None = None, session_id: str | None = None)
     current_node_id = state.get_current_node()
     current_node = graph.nodes.get(current_node_id) if current_node_id else None
 
-    # Get outgoing edges
-    outgoing_edges = graph.get_outgoing_edges(current_node_id) if current_node_id else []
-    edges_info = []
-    for edge in outgoing_edges:
-        edge_info = {
-            "id": edge.id,
-            "to": edge.to_node,
-            "to_name": graph.nodes[edge.to_node].name if edge.to_node in graph.nodes else edge.to_node,
-            "condition_type": edge.condition.type,
-            "priority": edge.priority
+    if not detailed:
+        return {
+            "session_id": sid,
+            "graph_name": state.active_graph or graph.metadata.get('name', 'unnamed'),
+            "current_node": {
+                "id": current_node_id,
+                "name": current_node.name if current_node else None,
+                "visits": state.get_visit_count(current_node_id) if current_node_id else 0
+            },
+            "total_transitions": state.total_transitions,
+            "last_activity": state.last_activity,
+            "project_dir": resolved_dir
         }
-        if edge.condition.tool:
-            edge_info["condition_tool"] = edge.condition.tool
-        if edge.condition.phrases:
-            edge_info["condition_phrases"] = edge.condition.phrases
-        edges_info.append(edge_info)
+
+    # Get outgoing edges
+    edges_info = graph.get_edges_info(current_node_id) if current_node_id else []
 
     # Check for visit warnings
     warnings = []
@@ -1439,11 +2158,6 @@ def graph_traverse(
         state = take_transition(graph, state, edge, reason)
         save_graph_state(resolved_dir, state)
     except MaxVisitsExceeded as e:
-        # Get alternative edges
-        other_edges = [
-            ed for ed in graph.get_outgoing_edges(current_node_id)
-            if ed.to_node != edge.to_node
-        ]
         return {
             "error": True,
             "session_id": sid,
@@ -1451,13 +2165,19 @@ def graph_traverse(
             "blocked_node": e.node_id,
             "visits": e.current_visits,
             "max_visits": e.max_visits,
-            "alternative_edges": [ed.id for ed in other_edges],
+            # Alternative edges from the current node
+            "alternative_edges": [
+                ed.id for ed in graph.get_outgoing_edges(current_node_id)
+                if ed.to_node != edge.to_node
+            ],
             "hint": "Use graph_override_max_visits() if you need to exceed the limit",
             "project_dir": resolved_dir
         }
 
     # Get new node info
     new_node = graph.nodes.get(state.get_current_node())
+    if new_node:
+        _schedule_warmup(new_node.mcps_enabled)
 
     return {
         "success": True,
@@ -1774,18 +2494,21 @@ def graph_validate(project_dir: str | None = None, session_id: str | None = None
             "project_dir": resolved_dir
         }
 
+    # The parsed graph is cached per file version and memoizes its own errors
     try:
-        graph = load_graph_from_file(graph_file)
+        graph = _load_graph_cached(graph_file)
+        errors = graph.validate()
     except GraphParseError as e:
+        graph, errors = None, [str(e)]
+
+    if graph is None:
         return {
             "valid": False,
             "session_id": sid,
-            "errors": [str(e)],
+            "errors": errors,
             "project_dir": resolved_dir
         }
 
-    errors = graph.validate()
-
     return {
         "valid": len(errors) == 0,
         "session_id": sid,
@@ -1859,6 +2582,43 @@ def graph_override_max_visits(
     }
 
 
+# Top-level `metadata:` fields per library graph: path -> ((st_mtime_ns, st_size), fields)
+_graph_metadata_cache: dict[Path, tuple[tuple[int, int], dict[str, str]]] = {}
+
+_GRAPH_METADATA_FIELDS = ("name", "description", "version")
+
+
+def _read_graph_metadata(yaml_file: Path) -> dict[str, str]:
+    """Read name/description/version from a graph file's metadata block.
+
+    Reading stops at the end of the block (nodes have `name:` keys too), and
+    the result is cached until the file's mtime or size changes.
+    """
+    return stat_cached(_graph_metadata_cache, yaml_file, _parse_graph_metadata)
+
+
+def _parse_graph_metadata(yaml_file: Path) -> dict[str, str]:
+    """Scan a graph file for its metadata fields (see _read_graph_metadata)."""
+    metadata: dict[str, str] = {}
+    in_metadata = False
+    with yaml_file.open() as f:
+        for line in f:
+            stripped = line.strip()
+            if not stripped or stripped.startswith('#'):
+                continue
+            if not line[0].isspace():
+                if in_metadata:
+                    break
+                in_metadata = stripped == "metadata:"
+                continue
+            if in_metadata:
+                key, sep, value = stripped.partition(':')
+                if sep and key in _GRAPH_METADATA_FIELDS and key not in metadata:
+                    metadata[key] = value.strip().strip('"').strip("'")
+
+    return metadata
+
+
 @mcp.tool()
 def graph_list_available(project_dir: str | None = None, session_id: str | None = None) -> dict:
     """List all available graphs in the project's pipelines library.
@@ -1885,23 +2645,12 @@ def graph_list_available(project_dir: str | None = None, session_id: str | None
     for yaml_file in pipelines_dir.glob("*-graph.yaml"):
         graph_name = yaml_file.stem
         try:
-            content = yaml_file.read_text()
-            name = graph_name
-            description = ""
-            version = ""
-            for line in content.split('\n'):
-                stripped = line.strip()
-                if stripped.startswith('name:'):
-                    name = stripped.split(':', 1)[1].strip().strip('"').strip("'")
-                elif stripped.startswith('description:'):
-                    description = stripped.split(':', 1)[1].strip().strip('"').strip("'")
-                elif stripped.startswith('version:'):
-                    version = stripped.split(':', 1)[1].strip().strip('"').strip("'")
+            metadata = _read_graph_metadata(yaml_file)
             graphs.append({
                 "id": graph_name,
-                "name": name,
-                "description": description,
-                "version": version,
+                "name": metadata.get("name") or graph_name,
+                "description": metadata.get("description", ""),
+                "version": metadata.get("version", ""),
                 "file": str(yaml_file),
                 "type": "graph"
             })
@@ -1968,8 +2717,8 @@ def graph_activate(
 
     # Copy to active graph.yaml
     target_file = get_graph_file(resolved_dir)
-    target_file.parent.mkdir(parents=True, exist_ok=True)
-    target_file.write_text(graph_file.read_text())
+    write_atomic(target_file, graph_file.read_text())
+    _active_graph_cache.pop(target_file, None)
 
     # Initialize state
     state = initialize_graph_state(resolved_dir, graph, graph_name)
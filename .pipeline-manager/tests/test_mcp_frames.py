@@ -0,0 +1,75 @@
+"""Oversized MCP responses must only fail the request they answer."""
+
+import asyncio
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from pipeline_manager import server
+
+# Answers concurrently; "big" replies with n bytes of text. With id_last the
+# id is the final key, as the MCP TypeScript SDK serializes responses.
+FAKE_MCP = textwrap.dedent('''
+    import json, sys, threading, time
+
+    lock = threading.Lock()
+
+    def handle(msg):
+        if msg["method"] == "initialize":
+            result = {"protocolVersion": "2024-11-05", "capabilities": {}}
+        elif msg["method"] == "tools/call":
+            args = msg["params"]["arguments"]
+            time.sleep(args.get("sleep", 0))
+            result = {"content": [{"type": "text", "text": "x" * args.get("n", 0) or args.get("text", "")}]}
+        else:
+            return
+        if "--id-last" in sys.argv:
+            out = {"result": result, "jsonrpc": "2.0", "id": msg["id"]}
+        else:
+            out = {"jsonrpc": "2.0", "id": msg["id"], "result": result}
+        with lock:
+            sys.stdout.write(json.dumps(out) + "\\n")
+            sys.stdout.flush()
+
+    for line in sys.stdin:
+        msg = json.loads(line)
+        if "id" in msg:
+            threading.Thread(target=handle, args=(msg,)).start()
+''')
+
+
+class OversizedFrameTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.script = Path(tempfile.mkdtemp()) / "fake_mcp.py"
+        self.script.write_text(FAKE_MCP)
+        patcher = mock.patch.object(server, "MAX_FRAME_SIZE", 64 * 1024)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def _call_pair(self, *args: str) -> tuple[dict, dict]:
+        conn = server.McpConnection("fake", sys.executable, [str(self.script), *args], {})
+        try:
+            return await asyncio.gather(
+                conn.call_tool("echo", {"text": "innocent", "sleep": 0.5}, 1),
+                conn.call_tool("big", {"n": 1024 * 1024}, 2),
+            )
+        finally:
+            await conn.stop()
+
+    async def _assert_only_big_fails(self, *args: str):
+        small, big = await self._call_pair(*args)
+        self.assertEqual(small["result"]["content"][0]["text"], "innocent")
+        self.assertIn("exceeded", big["error"]["message"])
+
+    async def test_id_first(self):
+        await self._assert_only_big_fails()
+
+    async def test_id_last(self):
+        await self._assert_only_big_fails("--id-last")
+
+
+if __name__ == "__main__":
+    unittest.main()